@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Iterator
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -24,24 +26,62 @@ from .const import (
 )
 from .coordinator import LambdaDataUpdateCoordinator
 from .utils import build_device_info, generate_base_addresses
-from .const_mapping import HP_ERROR_STATE  # noqa: F401
-from .const_mapping import HP_STATE  # noqa: F401
-from .const_mapping import HP_RELAIS_STATE_2ND_HEATING_STAGE  # noqa: F401
-from .const_mapping import HP_OPERATING_STATE  # noqa: F401
-from .const_mapping import HP_REQUEST_TYPE  # noqa: F401
-from .const_mapping import BOIL_CIRCULATION_PUMP_STATE  # noqa: F401
-from .const_mapping import BOIL_OPERATING_STATE  # noqa: F401
-from .const_mapping import HC_OPERATING_STATE  # noqa: F401
-from .const_mapping import HC_OPERATING_MODE  # noqa: F401
-from .const_mapping import BUFF_OPERATING_STATE  # noqa: F401
-from .const_mapping import BUFF_REQUEST_TYPE  # noqa: F401
-from .const_mapping import SOL_OPERATING_STATE  # noqa: F401
-from .const_mapping import MAIN_CIRCULATION_PUMP_STATE  # noqa: F401
-from .const_mapping import MAIN_AMBIENT_OPERATING_STATE  # noqa: F401
-from .const_mapping import MAIN_E_MANAGER_OPERATING_STATE  # noqa: F401
+from .const_mapping import (
+    HP_ERROR_STATE,
+    HP_STATE,
+    HP_RELAIS_STATE_2ND_HEATING_STAGE,
+    HP_OPERATING_STATE,
+    HP_REQUEST_TYPE,
+    BOIL_CIRCULATION_PUMP_STATE,
+    BOIL_OPERATING_STATE,
+    HC_OPERATING_STATE,
+    HC_OPERATING_MODE,
+    BUFF_OPERATING_STATE,
+    BUFF_REQUEST_TYPE,
+    SOL_OPERATING_STATE,
+    MAIN_CIRCULATION_PUMP_STATE,
+    MAIN_AMBIENT_OPERATING_STATE,
+    MAIN_E_MANAGER_OPERATING_STATE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Default device class derived from the sensor unit
+_UNIT_DEVICE_CLASS = {
+    "°C": SensorDeviceClass.TEMPERATURE,
+    "W": SensorDeviceClass.POWER,
+    "Wh": SensorDeviceClass.ENERGY,
+}
+
+# Sensor state class by the state_class string used in the templates
+_STATE_CLASS_MAP = {
+    "total": SensorStateClass.TOTAL,
+    "total_increasing": SensorStateClass.TOTAL_INCREASING,
+    "measurement": SensorStateClass.MEASUREMENT,
+}
+
+# Translation of a sensor base name into a state mapping name suffix
+_MAPPING_NAME_TRANS = str.maketrans({" ": "_", "-": "_"})
+
+# State mappings for txt_mapping sensors, keyed by mapping name
+_STATE_MAPPINGS = {
+    "HP_ERROR_STATE": HP_ERROR_STATE,
+    "HP_STATE": HP_STATE,
+    "HP_RELAIS_STATE_2ND_HEATING_STAGE": HP_RELAIS_STATE_2ND_HEATING_STAGE,
+    "HP_OPERATING_STATE": HP_OPERATING_STATE,
+    "HP_REQUEST_TYPE": HP_REQUEST_TYPE,
+    "BOIL_CIRCULATION_PUMP_STATE": BOIL_CIRCULATION_PUMP_STATE,
+    "BOIL_OPERATING_STATE": BOIL_OPERATING_STATE,
+    "HC_OPERATING_STATE": HC_OPERATING_STATE,
+    "HC_OPERATING_MODE": HC_OPERATING_MODE,
+    "BUFF_OPERATING_STATE": BUFF_OPERATING_STATE,
+    "BUFF_REQUEST_TYPE": BUFF_REQUEST_TYPE,
+    "SOL_OPERATING_STATE": SOL_OPERATING_STATE,
+    "MAIN_CIRCULATION_PUMP_STATE": MAIN_CIRCULATION_PUMP_STATE,
+    "MAIN_AMBIENT_OPERATING_STATE": MAIN_AMBIENT_OPERATING_STATE,
+    "MAIN_E_MANAGER_OPERATING_STATE": MAIN_E_MANAGER_OPERATING_STATE,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -60,6 +100,45 @@ async def async_setup_entry(
     coordinator = coordinator_data["coordinator"]
     _LOGGER.debug("Found coordinator: %s", coordinator)
 
+    # Hole den Legacy-Modbus-Namen-Switch aus der Config
+    use_legacy_modbus_names = entry.data.get("use_legacy_modbus_names", False)
+    name_prefix = entry.data.get("name", "").lower().replace(" ", "")
+
+    # Snapshot der deaktivierten Register für schnelle Prüfung
+    disabled_registers = frozenset(
+        getattr(coordinator, "disabled_registers", ())
+    )
+
+    # General sensors first so they are available immediately, then the
+    # (much larger) set of per-device sensors
+    async_add_entities(
+        _iter_general_sensors(
+            coordinator,
+            entry,
+            disabled_registers,
+            use_legacy_modbus_names,
+            name_prefix,
+        )
+    )
+    async_add_entities(
+        _iter_device_sensors(
+            coordinator,
+            entry,
+            disabled_registers,
+            use_legacy_modbus_names,
+            name_prefix,
+        )
+    )
+
+
+def _iter_device_sensors(
+    coordinator: LambdaDataUpdateCoordinator,
+    entry: ConfigEntry,
+    disabled_registers: frozenset[int],
+    use_legacy_modbus_names: bool,
+    name_prefix: str,
+) -> Iterator[LambdaSensor]:
+    """Yield the sensors of all configured devices (HP, Boil, HC, ...)."""
     # Get device counts from config
     num_hps = entry.data.get("num_hps", 1)
     num_boil = entry.data.get("num_boil", 1)
@@ -67,13 +146,6 @@ async def async_setup_entry(
     num_sol = entry.data.get("num_sol", 0)
     num_hc = entry.data.get("num_hc", 1)
 
-    # Hole den Legacy-Modbus-Namen-Switch aus der Config
-    use_legacy_modbus_names = entry.data.get("use_legacy_modbus_names", False)
-    name_prefix = entry.data.get("name", "").lower().replace(" ", "")
-
-    # Create sensors for each device type using a generic loop
-    sensors = []
-
     TEMPLATES = [
         ("hp", num_hps, HP_SENSOR_TEMPLATES),
         ("boil", num_boil, BOIL_SENSOR_TEMPLATES),
@@ -83,11 +155,14 @@ async def async_setup_entry(
     ]
 
     for prefix, count, template in TEMPLATES:
+        base_addresses = generate_base_addresses(prefix, count)
+        template_items = tuple(template.items())
+        prefix_upper = sys.intern(prefix.upper())
         for idx in range(1, count + 1):
-            base_address = generate_base_addresses(prefix, count)[idx]
-            for sensor_id, sensor_info in template.items():
+            base_address = base_addresses[idx]
+            for sensor_id, sensor_info in template_items:
                 address = base_address + sensor_info["relative_address"]
-                if coordinator.is_register_disabled(address):
+                if address in disabled_registers:
                     _LOGGER.debug(
                         "Skipping sensor %s (address %d) because register is "
                         "disabled",
@@ -95,13 +170,7 @@ async def async_setup_entry(
                         address,
                     )
                     continue
-                device_class = sensor_info.get("device_class")
-                if not device_class and sensor_info.get("unit") == "°C":
-                    device_class = SensorDeviceClass.TEMPERATURE
-                elif not device_class and sensor_info.get("unit") == "W":
-                    device_class = SensorDeviceClass.POWER
-                elif not device_class and sensor_info.get("unit") == "Wh":
-                    device_class = SensorDeviceClass.ENERGY
+                sensor_id_final = f"{prefix}{idx}_{sensor_id}"
 
                 # Prüfe auf Override-Name
                 override_name = None
@@ -110,87 +179,54 @@ async def async_setup_entry(
                     and hasattr(coordinator, "sensor_overrides")
                 ):
                     override_name = coordinator.sensor_overrides.get(
-                        f"{prefix}{idx}_{sensor_id}"
+                        sensor_id_final
                     )
                 if override_name:
                     name = override_name
-                    sensor_id_final = f"{prefix}{idx}_{sensor_id}"
                     # Data key (original format)
                     entity_id = (
                         f"sensor.{name_prefix}_{override_name}"
                     )
                     unique_id = f"{name_prefix}_{override_name}"
                 else:
-                    prefix_upper = prefix.upper()
                     if (
                         prefix == "hc"
                         and sensor_info.get("device_type") == "Climate"
                     ):
-                        name = (
-                            sensor_info["name"].format(idx)
-                        )
-                        if use_legacy_modbus_names:
-                            sensor_id_final = f"{prefix}{idx}_{sensor_id}"
-                            entity_id = (
-                                f"sensor.{name_prefix}_{prefix}{idx}_"
-                                f"{sensor_id}"
-                            )
-                        else:
-                            sensor_id_final = f"{prefix}{idx}_{sensor_id}"
-                            entity_id = f"sensor.{sensor_id_final}"
+                        name = sensor_info["name"].format(idx)
+                    else:
+                        name = f"{prefix_upper}{idx} {sensor_info['name']}"
+                    if use_legacy_modbus_names:
+                        entity_id = f"sensor.{name_prefix}_{sensor_id_final}"
                     else:
-                        name = (
-                            f"{prefix_upper}{idx} {sensor_info['name']}"
-                        )
-                        if use_legacy_modbus_names:
-                            sensor_id_final = f"{prefix}{idx}_{sensor_id}"
-                            entity_id = (
-                                f"sensor.{name_prefix}_{prefix}{idx}_"
-                                f"{sensor_id}"
-                            )
-                        else:
-                            sensor_id_final = f"{prefix}{idx}_{sensor_id}"
-                            entity_id = f"sensor.{sensor_id_final}"
+                        entity_id = f"sensor.{sensor_id_final}"
                     unique_id = entity_id.replace("sensor.", "")
 
-                device_type = (
-                    prefix.upper() if prefix in [
-                        "hp",
-                        "boil",
-                        "hc",
-                        "buff",
-                        "sol",
-                    ]
-                    else sensor_info.get("device_type", "main")
+                yield _make_sensor(
+                    coordinator,
+                    entry,
+                    sensor_id_final,
+                    sensor_info,
+                    name=name,
+                    address=address,
+                    relative_address=sensor_info.get("relative_address", 0),
+                    device_type=prefix_upper,
+                    entity_id=entity_id,
+                    unique_id=unique_id,
                 )
 
-                sensors.append(
-                    LambdaSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        sensor_id=sensor_id_final,
-                        name=name,
-                        unit=sensor_info.get("unit", ""),
-                        address=address,
-                        scale=sensor_info.get("scale", 1.0),
-                        state_class=sensor_info.get("state_class", ""),
-                        device_class=device_class,
-                        relative_address=sensor_info.get(
-                            "relative_address", 0
-                        ),
-                        data_type=sensor_info.get("data_type", None),
-                        device_type=device_type,
-                        txt_mapping=sensor_info.get("txt_mapping", False),
-                        precision=sensor_info.get("precision", None),
-                        entity_id=entity_id,
-                        unique_id=unique_id,
-                    )
-                )
 
-    # General Sensors (SENSOR_TYPES)
+def _iter_general_sensors(
+    coordinator: LambdaDataUpdateCoordinator,
+    entry: ConfigEntry,
+    disabled_registers: frozenset[int],
+    use_legacy_modbus_names: bool,
+    name_prefix: str,
+) -> Iterator[LambdaSensor]:
+    """Yield the general sensors (SENSOR_TYPES)."""
     for sensor_id, sensor_info in SENSOR_TYPES.items():
         address = sensor_info["address"]
-        if coordinator.is_register_disabled(address):
+        if address in disabled_registers:
             _LOGGER.debug(
                 "Skipping general sensor %s (address %d) because register is "
                 "disabled",
@@ -198,14 +234,6 @@ async def async_setup_entry(
                 address,
             )
             continue
-        device_class = sensor_info.get("device_class")
-        if not device_class and sensor_info.get("unit") == "°C":
-            device_class = SensorDeviceClass.TEMPERATURE
-        elif not device_class and sensor_info.get("unit") == "W":
-            device_class = SensorDeviceClass.POWER
-        elif not device_class and sensor_info.get("unit") == "Wh":
-            device_class = SensorDeviceClass.ENERGY
-
         # Name und Entity-ID
         if use_legacy_modbus_names and "override_name" in sensor_info:
             name = sensor_info["override_name"]
@@ -223,36 +251,77 @@ async def async_setup_entry(
         else:
             entity_id = f"sensor.{sensor_id_final}"
 
-        sensors.append(
-            LambdaSensor(
-                coordinator=coordinator,
-                entry=entry,
-                sensor_id=sensor_id_final,
-                name=name,
-                unit=sensor_info.get("unit", ""),
-                address=address,
-                scale=sensor_info.get("scale", 1.0),
-                state_class=sensor_info.get("state_class", ""),
-                device_class=device_class,
-                relative_address=sensor_info.get("address", 0),
-                data_type=sensor_info.get("data_type", None),
-                device_type=sensor_info.get("device_type", None),
-                txt_mapping=sensor_info.get("txt_mapping", False),
-                precision=sensor_info.get("precision", None),
-                entity_id=entity_id,
-            )
+        yield _make_sensor(
+            coordinator,
+            entry,
+            sensor_id_final,
+            sensor_info,
+            name=name,
+            address=address,
+            relative_address=sensor_info.get("address", 0),
+            device_type=sensor_info.get("device_type", None),
+            entity_id=entity_id,
         )
 
-    _LOGGER.debug(
-        "Created %d sensors",
-        len(sensors),
+
+def _make_sensor(
+    coordinator: LambdaDataUpdateCoordinator,
+    entry: ConfigEntry,
+    sensor_id: str,
+    sensor_info: dict,
+    name: str,
+    address: int,
+    relative_address: int,
+    device_type: str | None,
+    entity_id: str,
+    unique_id: str | None = None,
+) -> LambdaSensor:
+    """Create a LambdaSensor from a sensor template entry."""
+    unit = sensor_info.get("unit", "")
+    return LambdaSensor(
+        coordinator=coordinator,
+        entry=entry,
+        sensor_id=sensor_id,
+        name=name,
+        unit=unit,
+        address=address,
+        scale=sensor_info.get("scale", 1.0),
+        state_class=sensor_info.get("state_class", ""),
+        device_class=(
+            sensor_info.get("device_class") or _UNIT_DEVICE_CLASS.get(unit)
+        ),
+        relative_address=relative_address,
+        data_type=sensor_info.get("data_type", None),
+        device_type=device_type,
+        txt_mapping=sensor_info.get("txt_mapping", False),
+        precision=sensor_info.get("precision", None),
+        entity_id=entity_id,
+        unique_id=unique_id,
     )
-    async_add_entities(sensors)
 
 
 class LambdaSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Lambda sensor."""
 
+    # Fixed per-instance configuration; the entity base classes still
+    # provide a __dict__ for the HA-managed attributes
+    __slots__ = (
+        "_entry",
+        "_sensor_id",
+        "_unit",
+        "_address",
+        "_scale",
+        "_state_class",
+        "_device_class",
+        "_relative_address",
+        "_data_type",
+        "_device_type",
+        "_txt_mapping",
+        "_precision",
+        "_is_state_sensor",
+        "_state_mapping",
+    )
+
     _attr_has_entity_name = True
     _attr_should_poll = False
 
@@ -276,10 +345,31 @@ class LambdaSensor(CoordinatorEntity, SensorEntity):
         unique_id: str | None = None,
     ) -> None:
         super().__init__(coordinator)
+        use_legacy_modbus_names = entry.data.get(
+            "use_legacy_modbus_names", False
+        )
+        # Prüfe auf Override-Name (nur einmal bei der Initialisierung);
+        # der Coordinator speichert den Wert dann unter dem Override-Namen
+        data_key = sensor_id
+        if (
+            use_legacy_modbus_names
+            and hasattr(coordinator, "sensor_overrides")
+        ):
+            override_name = coordinator.sensor_overrides.get(sensor_id)
+            if override_name:
+                _LOGGER.debug(
+                    "Overriding name and data key of sensor %s to %s",
+                    sensor_id,
+                    override_name,
+                )
+                name = override_name
+                data_key = override_name
+
         self._entry = entry
-        self._sensor_id = sensor_id
+        self._sensor_id = data_key
         self._attr_name = name
         self._attr_unique_id = unique_id or sensor_id
+        self._attr_device_info = build_device_info(entry)
         self.entity_id = entity_id or f"sensor.{sensor_id}"
         self._unit = unit
         self._address = address
@@ -293,26 +383,17 @@ class LambdaSensor(CoordinatorEntity, SensorEntity):
         self._precision = precision
 
         _LOGGER.debug(
-            "Sensor initialized with ID: %s and config: %s",
+            "Sensor initialized: id=%s address=%d unit=%s",
             sensor_id,
-            {
-                "name": name,
-                "unit": unit,
-                "address": address,
-                "scale": scale,
-                "state_class": state_class,
-                "device_class": device_class,
-                "relative_address": relative_address,
-                "data_type": data_type,
-                "device_type": device_type,
-                "txt_mapping": txt_mapping,
-                "precision": precision,
-            },
+            address,
+            unit,
         )
 
         self._is_state_sensor = txt_mapping
+        self._state_mapping = None
 
         if self._is_state_sensor:
+            self._state_mapping = self._resolve_state_mapping()
             self._attr_device_class = None
             self._attr_state_class = None
             self._attr_native_unit_of_measurement = None
@@ -321,101 +402,65 @@ class LambdaSensor(CoordinatorEntity, SensorEntity):
             self._attr_native_unit_of_measurement = unit
             if precision is not None:
                 self._attr_suggested_display_precision = precision
-            if unit == "°C":
-                self._attr_device_class = SensorDeviceClass.TEMPERATURE
-            elif unit == "W":
-                self._attr_device_class = SensorDeviceClass.POWER
-            elif unit == "Wh":
-                self._attr_device_class = SensorDeviceClass.ENERGY
-            if state_class:
-                if state_class == "total":
-                    self._attr_state_class = SensorStateClass.TOTAL
-                elif state_class == "total_increasing":
-                    self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-                elif state_class == "measurement":
-                    self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        use_legacy_modbus_names = self.coordinator.entry.data.get(
-            "use_legacy_modbus_names", False
+            if device_class:
+                self._attr_device_class = device_class
+            self._attr_state_class = _STATE_CLASS_MAP.get(state_class)
+
+    def _resolve_state_mapping(self) -> dict | None:
+        """Return the state mapping dictionary for this state sensor."""
+        # Extract base name without index
+        # (e.g. "HP1 Operating State" -> "Operating State")
+        base_name = self._attr_name
+        device_type = (self._device_type or "").upper()
+        if device_type and device_type in base_name:
+            # Remove prefix and index (e.g. "HP1 " or "BOIL2 ")
+            base_name = ' '.join(base_name.split()[1:])
+        # Ersetze Leerzeichen und Bindestriche durch Unterstriche
+        mapping_name = (
+            f"{device_type}_{base_name.upper().translate(_MAPPING_NAME_TRANS)}"
         )
-        if (
-            use_legacy_modbus_names
-            and hasattr(self.coordinator, "sensor_overrides")
-        ):
-            override_name = self.coordinator.sensor_overrides.get(
-                self._sensor_id
+        state_mapping = _STATE_MAPPINGS.get(mapping_name)
+        if state_mapping is None:
+            _LOGGER.warning(
+                "No state mapping found f. sensor '%s' (tried mapping: %s). "
+                "Sensor details: device_type=%s, register=%d, data_type=%s. "
+                "This sensor is marked as state sensor (txt_mapping=True) "
+                "but no corresponding mapping dictionary was found.",
+                self._attr_name,
+                mapping_name,
+                self._device_type,
+                self._relative_address,
+                self._data_type,
             )
-            if override_name:
-                # Verwende den Override-Namen als sensor_id
-                _LOGGER.debug(
-                    "Overriding sensor_id from %s to %s",
-                    self._sensor_id,
-                    override_name,
-                )
-                self._sensor_id = override_name
-                return override_name
-        return self._attr_name
+        return state_mapping
 
     @property
     def native_value(self) -> float | str | None:
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        value = self.coordinator.data.get(self._sensor_id)
+        value = data.get(self._sensor_id)
         if value is None:
             return None
         if self._is_state_sensor:
-            try:
-                numeric_value = int(float(value))
-            except (ValueError, TypeError):
-                return f"Unknown state ({value})"
-
-            # Extract base name without index
-            # (e.g. "HP1 Operating State" -> "Operating State")
-            base_name = self._attr_name
-            if self._device_type and self._device_type.upper() in base_name:
-                # Remove prefix and index (e.g. "HP1 " or "BOIL2 ")
-                base_name = ' '.join(base_name.split()[1:])
-            # Ersetze auch Bindestriche durch Unterstriche
-            mapping_name = (
-                f"{self._device_type.upper()}_"
-                f"{base_name.upper().replace(' ', '_').replace('-', '_')}"
-            )
-            try:
-                state_mapping = globals().get(mapping_name)
-                if state_mapping is not None:
-                    return state_mapping.get(
-                        numeric_value,
-                        f"Unknown state ({numeric_value})"
-                    )
-                _LOGGER.warning(
-                    "No state mapping found f. sensor '%s' (tried mapping: %s)"
-                    "with value %s. Sensor details: device_type=%s, "
-                    "register=%d, data_type=%s. This sensor is marked as state"
-                    "sensor (txt_mapping=True) but no corresponding mapping "
-                    "dictionary was found.",
-                    self._attr_name,
-                    mapping_name,
-                    numeric_value,
-                    self._device_type,
-                    self._relative_address,
-                    self._data_type,
-                )
+            if isinstance(value, int):
+                numeric_value = value
+            else:
+                try:
+                    numeric_value = int(float(value))
+                except (ValueError, TypeError):
+                    return f"Unknown state ({value})"
+            if self._state_mapping is None:
                 return f"Unknown mapping for state ({numeric_value})"
-            except Exception as e:
-                _LOGGER.error(
-                    "Error accessing mapping dictionary: %s",
-                    str(e),
-                )
-                return f"Error loading mappings ({numeric_value})"
+            return self._state_mapping.get(
+                numeric_value, f"Unknown state ({numeric_value})"
+            )
+        # Fast path: the coordinator normally delivers int/float values
+        if isinstance(value, float):
+            return value
+        if isinstance(value, int):
+            return float(value)
         try:
             return float(value)
         except (ValueError, TypeError):
             return None
-
-    @property
-    def device_info(self):
-        """Return device info for this sensor."""
-        return build_device_info(self._entry)
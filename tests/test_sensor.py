@@ -70,6 +70,7 @@ def mock_coordinator():
         "hp1_operating_state": 2
     }
     coordinator.sensor_overrides = {}
+    coordinator.disabled_registers = set()
     return coordinator
 
 
@@ -89,7 +90,8 @@ async def test_async_setup_entry_no_coordinator(mock_hass, mock_entry):
 @pytest.mark.asyncio
 async def test_async_setup_entry_with_coordinator(mock_hass, mock_entry, mock_coordinator):
     """Test async setup entry with coordinator."""
-    mock_add_entities = AsyncMock()
+    # Consume the sensor generators passed to async_add_entities
+    mock_add_entities = Mock(side_effect=list)
     mock_hass.data[DOMAIN] = {mock_entry.entry_id: {"coordinator": mock_coordinator}}
     
     with patch("custom_components.lambda_heat_pumps.sensor.LambdaSensor") as mock_sensor_class:
@@ -98,16 +100,18 @@ async def test_async_setup_entry_with_coordinator(mock_hass, mock_entry, mock_co
         
         result = await async_setup_entry(mock_hass, mock_entry, mock_add_entities)
         
-        # Should call add_entities
-        mock_add_entities.assert_called()
+        # Should add general sensors and device sensors separately
+        assert mock_add_entities.call_count == 2
+        mock_sensor_class.assert_called()
 
 
 @pytest.mark.asyncio
 async def test_async_setup_entry_with_disabled_registers(mock_hass, mock_entry, mock_coordinator):
     """Test async setup entry with disabled registers."""
-    mock_add_entities = AsyncMock()
+    # Consume the sensor generators passed to async_add_entities
+    mock_add_entities = Mock(side_effect=list)
     mock_hass.data[DOMAIN] = {mock_entry.entry_id: {"coordinator": mock_coordinator}}
-    mock_coordinator.is_register_disabled.return_value = True
+    mock_coordinator.disabled_registers = set(range(0, 10000))
     
     with patch("custom_components.lambda_heat_pumps.sensor.LambdaSensor") as mock_sensor_class:
         mock_sensor = Mock()
@@ -117,6 +121,33 @@ async def test_async_setup_entry_with_disabled_registers(mock_hass, mock_entry,
         
         # Should call add_entities but skip disabled registers
         mock_add_entities.assert_called()
+        mock_sensor_class.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_skips_only_disabled_registers(mock_hass, mock_entry, mock_coordinator):
+    """Test async setup entry skips only the disabled register addresses."""
+    # Consume the sensor generators passed to async_add_entities
+    mock_add_entities = Mock(side_effect=list)
+    mock_hass.data[DOMAIN] = {mock_entry.entry_id: {"coordinator": mock_coordinator}}
+    # Address 0 is the first general sensor (ambient_error_number)
+    mock_coordinator.disabled_registers = {0}
+    
+    with patch("custom_components.lambda_heat_pumps.sensor.LambdaSensor") as mock_sensor_class:
+        mock_sensor_class.return_value = Mock()
+        
+        await async_setup_entry(mock_hass, mock_entry, mock_add_entities)
+        
+        addresses = [
+            call.kwargs["address"] for call in mock_sensor_class.call_args_list
+        ]
+        sensor_ids = [
+            call.kwargs["sensor_id"] for call in mock_sensor_class.call_args_list
+        ]
+        assert 0 not in addresses
+        assert "ambient_error_number" not in sensor_ids
+        assert "ambient_operating_state" in sensor_ids
+        assert "hp1_error_state" in sensor_ids
 
 
 @pytest.mark.asyncio
@@ -177,7 +208,7 @@ def test_lambda_sensor_init(mock_entry, mock_coordinator):
 
 def test_lambda_sensor_name_property(mock_entry, mock_coordinator):
     """Test LambdaSensor name property."""
-    sensor = LambdaSensor(
+    sensor_kwargs = dict(
         coordinator=mock_coordinator,
         entry=mock_entry,
         sensor_id="hp1_temperature",
@@ -195,14 +226,19 @@ def test_lambda_sensor_name_property(mock_entry, mock_coordinator):
         entity_id="sensor.hp1_temperature",
         unique_id="hp1_temperature"
     )
-    
+
     # Test with sensor_overrides
     mock_coordinator.sensor_overrides = {"hp1_temperature": "Custom Name"}
     mock_entry.data = {"use_legacy_modbus_names": True}
+    sensor = LambdaSensor(**sensor_kwargs)
     assert sensor.name == "Custom Name"
-    
+    # The coordinator stores overridden values under the override name
+    mock_coordinator.data = {"Custom Name": 21.0}
+    assert sensor.native_value == 21.0
+
     # Test without sensor_overrides
     mock_coordinator.sensor_overrides = {}
+    sensor = LambdaSensor(**sensor_kwargs)
     assert sensor.name == "Test Sensor"
 
 
@@ -255,32 +291,48 @@ def test_lambda_sensor_native_value_with_data(mock_entry, mock_coordinator):
     
     assert sensor.native_value == 20.5
 
+    mock_coordinator.data = {"hp1_temperature": 20}
+    assert sensor.native_value == 20.0
+    assert isinstance(sensor.native_value, float)
+
+    mock_coordinator.data = {"hp1_temperature": "20.5"}
+    assert sensor.native_value == 20.5
+
+    mock_coordinator.data = {"hp1_temperature": "invalid"}
+    assert sensor.native_value is None
+
 
 def test_lambda_sensor_native_value_with_txt_mapping(mock_entry, mock_coordinator):
     """Test LambdaSensor native_value with text mapping."""
-    sensor = LambdaSensor(
-        coordinator=mock_coordinator,
-        entry=mock_entry,
-        sensor_id="hp1_state",
-        name="HP1 Operating State",
-        unit="",
-        address=1000,
-        scale=1.0,
-        state_class="",
-        device_class=None,
-        relative_address=0,
-        data_type="int16",
-        device_type="HP",
-        txt_mapping=True,
-        precision=None,
-        entity_id="sensor.hp1_state",
-        unique_id="hp1_state"
-    )
+    # Mock the text mapping (resolved once on initialization)
+    with patch.dict(
+        "custom_components.lambda_heat_pumps.sensor._STATE_MAPPINGS",
+        {"HP_OPERATING_STATE": {1: "Running"}},
+    ):
+        sensor = LambdaSensor(
+            coordinator=mock_coordinator,
+            entry=mock_entry,
+            sensor_id="hp1_state",
+            name="HP1 Operating State",
+            unit="",
+            address=1000,
+            scale=1.0,
+            state_class="",
+            device_class=None,
+            relative_address=0,
+            data_type="int16",
+            device_type="HP",
+            txt_mapping=True,
+            precision=None,
+            entity_id="sensor.hp1_state",
+            unique_id="hp1_state"
+        )
     mock_coordinator.data = {"hp1_state": 1}
-    
-    # Mock the text mapping
-    with patch("custom_components.lambda_heat_pumps.sensor.HP_OPERATING_STATE", {1: "Running"}):
-        assert sensor.native_value == "Running"
+
+    assert sensor.native_value == "Running"
+
+    mock_coordinator.data = {"hp1_state": 99}
+    assert sensor.native_value == "Unknown state (99)"
 
 
 def test_lambda_sensor_native_value_with_precision(mock_entry, mock_coordinator):